@@ -1,11 +1,95 @@
 # src\analysis\dividend\dividend_analysis.py
 
-from typing import Tuple, Optional, Dict, List, Any
+from typing import Tuple, Optional, Dict, List, Any, Union
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta, timezone
-from utils.date_util import DateNormalizer
-from models.dividend_models import ExDividendPattern, DividendGapResult, DividendFrequency
+from models.dividend_models import (ExDividendPattern, DividendGapResult, DividendFrequency, DividendArrays,
+                                    EPOCH_ORDINAL)
+
+logger = logging.getLogger(__name__)
+
+
+# std dev cutoffs (in days) of the ex-dividend day pattern and the staleness tolerance factor for each band
+_STD_CUTOFFS = np.array([2.0, 4.0])
+_STD_FACTORS = np.array([1.0, 1.0, 1.1])
+
+# exact type -> converter to a plain date, looked up once instead of walking isinstance checks
+_DATE_CONVERTERS = {
+    date: lambda x: x,
+    datetime: lambda x: x.date(),
+    pd.Timestamp: lambda x: x.date(),
+    np.datetime64: lambda x: pd.Timestamp(x).date(),
+}
+
+
+
+def _as_arrays(dividends: Union[pd.Series, DividendArrays]) -> DividendArrays:
+    """Accept either a raw dividend series or prebuilt DividendArrays"""
+    return dividends if isinstance(dividends, DividendArrays) else DividendArrays.from_series(dividends)
+
+
+
+def _median(values: np.ndarray) -> float:
+    """
+    Median of a 1D array using an in-place partial sort.
+
+    np.median fully sorts a copy of the data, but only the middle element(s) are needed.
+    Note: values is reordered, only pass arrays that are owned by the caller.
+    Returns nan for an empty array, same as np.median.
+    """
+    n = len(values)
+    if n == 0:
+        return float('nan')
+    k = n // 2
+    if n % 2:
+        values.partition(k)
+        return float(values[k])
+    values.partition([k - 1, k])
+    return (float(values[k - 1]) + float(values[k])) / 2
+
+
+
+def _frequency_core(days: np.ndarray, cutoff: int, min_intervals: int) -> Tuple[int, float, float]:
+    """
+    Numeric core of the frequency analysis, kept free of pandas objects.
+
+    Args:
+        days: Sorted ex-dividend dates as int64 days since epoch
+        cutoff: First day (days since epoch) considered recent history
+        min_intervals: Min number of intervals needed to perform analysis
+
+    Returns:
+        Tuple of (n_valid, avg_interval, std_dev):
+            - n_valid: Number of positive intervals found
+            - avg_interval: Median interval in days, nan if it can't be determined
+            - std_dev: Sample std dev of all positive intervals
+    """
+    # int64 days in, int64 day intervals out, no float copy needed
+    intervals = np.diff(days)
+    valid_intervals = intervals[intervals > 0]
+    n_valid = len(valid_intervals)
+    if n_valid < min_intervals:
+        return n_valid, float('nan'), float('nan')
+
+    # dates are sorted, so the recent intervals are a tail slice starting at the first date on/after the cutoff
+    recent_intervals = intervals[np.searchsorted(days, cutoff, side='left'):]
+    
+    # get the avg interval over the recent history
+    # both median inputs are fresh copies from boolean masks, so they can be partitioned in place
+    if len(recent_intervals) >= min_intervals:
+        avg_interval = _median(recent_intervals[recent_intervals > 0])
+    else:
+        avg_interval = _median(valid_intervals)
+
+    # sample std dev in a single pass over the interval buffer, order doesn't matter if it was partitioned above
+    mean_interval = valid_intervals.mean(dtype=np.float64)
+    std_dev = float(np.sqrt(((valid_intervals.astype(np.float64) - mean_interval) ** 2).sum() / (n_valid - 1)))
+    
+    return n_valid, avg_interval, std_dev
 
 
 
@@ -30,7 +114,8 @@ class DividendPatternAnalyzer:
 
 
     @staticmethod
-    def analyze_dividend_frequency(dividends: pd.Series) -> Tuple[Optional[str], Optional[float]]:
+    def analyze_dividend_frequency(dividends: Union[pd.Series, DividendArrays],
+                                   now: Optional[date] = None) -> Tuple[Optional[str], Optional[float]]:
         """
         Determines the frequency of ex-dividends (yes, EX-dividends) and the average intervals between them
         
@@ -38,7 +123,8 @@ class DividendPatternAnalyzer:
         Focuses on recent history to handle cases where companies have changed their dividend patterns.
 
         Args:
-            dividends: Time series of dividend payments with dates as index
+            dividends: Time series of dividend payments with dates as index, or its DividendArrays
+            now: Today's date, defaults to date.today(). Pass it in to share one clock read across a batch
             
         Returns:
             Tuple of (frequency, interval):
@@ -46,50 +132,91 @@ class DividendPatternAnalyzer:
                 - interval: Average days between payments or None
         """
         try:
-            if dividends.empty or len(dividends) < 2:
+            # size guards first, so tiny histories never pay for the index conversion
+            n_dividends = len(dividends)
+            if n_dividends < 2:
                 return None, None
-
-            dates_array = dividends.index.values.astype('datetime64[D]')
-            intervals = np.diff(dates_array).astype(float)
-            valid_mask = (intervals > 0) & np.isfinite(intervals)
-            valid_intervals = intervals[valid_mask]
-            
-            if len(valid_intervals) < DividendPatternAnalyzer.MIN_INTERVALS_REQUIRED:
-                print(len(valid_intervals))
+            if n_dividends < DividendPatternAnalyzer.MIN_INTERVALS_REQUIRED + 1:
+                logger.debug("insufficient valid intervals: %d", n_dividends - 1)
                 return "insufficient_data", 0.0
-                
+            
+            arrays = _as_arrays(dividends)
 
-            # focus on recent history to get frequency
-            recent_cutoff = np.datetime64('now', 'D') - np.timedelta64(DividendPatternAnalyzer.RECENT_HISTORY_DAYS, 'D')
-            recent_mask = dates_array >= recent_cutoff
+            # work on integer day ordinals so the numeric core never touches pandas
+            today = now or date.today()
+            recent_cutoff = today.toordinal() - EPOCH_ORDINAL - DividendPatternAnalyzer.RECENT_HISTORY_DAYS
+            
+            n_valid, avg_interval, std_dev = _frequency_core(
+                arrays.ordinals, recent_cutoff, DividendPatternAnalyzer.MIN_INTERVALS_REQUIRED
+            )
             
-            # get the avg interval over the recent history
-            if np.sum(recent_mask[:-1]) >= DividendPatternAnalyzer.MIN_INTERVALS_REQUIRED:
-                recent_intervals = np.diff(dates_array[recent_mask]).astype(float)
-                avg_interval = float(np.median(recent_intervals[recent_intervals > 0]))
-            else:
-                avg_interval = float(np.median(valid_intervals))
+            if n_valid < DividendPatternAnalyzer.MIN_INTERVALS_REQUIRED:
+                logger.debug("insufficient valid intervals: %d", n_valid)
+                return "insufficient_data", 0.0
                 
             if not np.isfinite(avg_interval) or avg_interval <= 0:
                 return "unknown", 0.0
                 
-            std_dev = float(np.std(valid_intervals, ddof=1))
             cv = std_dev / avg_interval if avg_interval > 0 else float('inf')
             
             # map the interval to freq using predefined ranges
-            for (lower, upper), freq in DividendFrequency.INTERVAL_RANGES.items():
-                if lower <= avg_interval < upper:
-                    return freq, avg_interval
-                    
-            return "unknown", avg_interval
+            return DividendFrequency.classify(avg_interval), avg_interval
 
         except Exception as e:
-            print(f"Error in frequency calculation: {str(e)}")
+            logger.warning("Error in frequency calculation: %s", e)
             return "unknown", 0.0
 
 
 
 
+    @staticmethod
+    def normalize_calendar(calendar: Optional[Dict]) -> Dict[str, Optional[date]]:
+        """
+        Extract the dividend dates from a calendar dictionary as plain dates.
+
+        The analyzer methods accept the result in place of the raw calendar, so the calendar 
+        only has to be normalized once per ticker. Already normalized input is returned as is.
+
+        Args:
+            calendar: Raw calendar dictionary from Yahoo Finance, or the output of this method
+            
+        Returns:
+            Dict with "Dividend Date" and "Ex-Dividend Date", each a date or None if unavailable
+        """
+        if not calendar or not isinstance(calendar, dict):
+            return {"Dividend Date": None, "Ex-Dividend Date": None}
+        
+        div_date = calendar.get("Dividend Date")
+        ex_date = calendar.get("Ex-Dividend Date")
+        
+        # skip the work if the calendar was already normalized
+        if (
+            calendar.keys() == {"Dividend Date", "Ex-Dividend Date"}
+            and type(div_date) in (date, type(None))
+            and type(ex_date) in (date, type(None))
+        ):
+            return calendar
+        
+        return {
+            "Dividend Date": DividendPatternAnalyzer._as_date(div_date),
+            "Ex-Dividend Date": DividendPatternAnalyzer._as_date(ex_date)
+        }
+
+
+
+
+    @staticmethod
+    def _as_date(value: Any) -> Optional[date]:
+        """Convert a date, datetime, Timestamp or datetime64 to a plain date, None for anything else"""
+        convert = _DATE_CONVERTERS.get(type(value))
+        if convert is None and isinstance(value, date):
+            # subclasses of date/datetime not listed in the table
+            convert = _DATE_CONVERTERS[datetime] if isinstance(value, datetime) else _DATE_CONVERTERS[date]
+        return convert(value) if convert is not None else None
+
+
+
+
     @classmethod
     def analyze_dividend_gap(cls, calendar: Dict, avg_interval: Optional[float]) -> DividendGapResult:
         """
@@ -101,7 +228,7 @@ class DividendPatternAnalyzer:
         If there is no calendar data, the returned gap is a complete guess.
 
         Args:
-            calendar: Dictionary containing dividend calendar dates
+            calendar: Dictionary containing dividend calendar dates, raw or from normalize_calendar
             avg_interval: Average days between payments
             
         Returns:
@@ -112,40 +239,40 @@ class DividendPatternAnalyzer:
         """
         
     
-        if calendar and isinstance(calendar, dict):
-            div_date = calendar.get("Dividend Date")
-            ex_date = calendar.get("Ex-Dividend Date")
+        calendar = cls.normalize_calendar(calendar)
+        div_date = calendar["Dividend Date"]
+        ex_date = calendar["Ex-Dividend Date"]
+        
+        if div_date is not None and ex_date is not None:
+            gap = (div_date - ex_date).days
             
-            if all(isinstance(d, (date, datetime)) for d in [div_date, ex_date]):
-                gap = (div_date - ex_date).days
-                
-                # If we have avg_interval and gap is larger than it,
-                # this likely means we're seeing next cycle's dividend date
-                if avg_interval and gap > avg_interval:
-                    adjusted_gap = gap - int(avg_interval)
-                    if 0 <= adjusted_gap <= 60:
-                        return DividendGapResult(
-                            gap_days=adjusted_gap,
-                            confidence="moderate",
-                            estimation_method="exdiv_predicted_direct_calendar"
-                        )
-                elif 0 <= gap <= 60:
+            # If we have avg_interval and gap is larger than it,
+            # this likely means we're seeing next cycle's dividend date
+            if avg_interval and gap > avg_interval:
+                adjusted_gap = gap - int(avg_interval)
+                if 0 <= adjusted_gap <= 60:
                     return DividendGapResult(
-                        gap_days=gap,
-                        confidence="high",
-                        estimation_method="direct_calendar"
+                        gap_days=adjusted_gap,
+                        confidence="moderate",
+                        estimation_method="exdiv_predicted_direct_calendar"
+                    )
+            elif 0 <= gap <= 60:
+                return DividendGapResult(
+                    gap_days=gap,
+                    confidence="high",
+                    estimation_method="direct_calendar"
+                )
+            
+            if avg_interval:
+                # Handle case where dividend date precedes ex-dividend date
+                estimated_last_ex_date = ex_date - timedelta(days=int(avg_interval))
+                calculated_gap = (div_date - estimated_last_ex_date).days
+                if 0 <= calculated_gap <= 60:
+                    return DividendGapResult(
+                        gap_days=calculated_gap,
+                        confidence="moderate",
+                        estimation_method="div_predicted_direct_calendar"
                     )
-                
-                if avg_interval:
-                    # Handle case where dividend date precedes ex-dividend date
-                    estimated_last_ex_date = ex_date - timedelta(days=int(avg_interval))
-                    calculated_gap = (div_date - estimated_last_ex_date).days
-                    if 0 <= calculated_gap <= 60:
-                        return DividendGapResult(
-                            gap_days=calculated_gap,
-                            confidence="moderate",
-                            estimation_method="div_predicted_direct_calendar"
-                        )
         
         # Hail Mary fallback - the gap is 1/3 the avg interval
         # i.e. For a quarterly paying dividend (~90 day interval), the gap is assumed to be 30
@@ -192,54 +319,70 @@ class DividendPatternAnalyzer:
         base_threshold = 1.2 if avg_interval >= 60 else 1.1
         
         # if the pattern is usually consistent (low std), give less tolerance
-        variance_factor = 1 if pattern.std_dev_days < 2 else \
-                         1.0 if pattern.std_dev_days < 4 else 1.1
-                         
+        variance_factor = _STD_FACTORS[np.searchsorted(_STD_CUTOFFS, pattern.std_dev_days, side='right')]
         
-        return base_threshold * variance_factor
+        return float(base_threshold * variance_factor)
+
+
+
+
+    @staticmethod
+    def calculate_staleness_threshold_batch(intervals: np.ndarray, std_devs: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_staleness_threshold for many tickers at once.
+        
+        Args:
+            intervals: Average days between payments for each ticker
+            std_devs: Std dev of the ex-dividend day pattern for each ticker
+            
+        Returns:
+            np.ndarray: Multiplier threshold for each ticker
+        """
+        base_thresholds = np.where(np.asarray(intervals) >= 60, 1.2, 1.1)
+        return base_thresholds * _STD_FACTORS[np.searchsorted(_STD_CUTOFFS, std_devs, side='right')]
 
 
 
 
 
     @classmethod
-    def analyze_ex_dividend_patterns(cls, dividends: pd.Series) -> ExDividendPattern:
+    def analyze_ex_dividend_patterns(cls, dividends: Union[pd.Series, DividendArrays],
+                                     now: Optional[date] = None) -> ExDividendPattern:
         """ 
         Function that analyzes/calculates historical data on dividends (really ex-div, since yFinance only gives historical ex-div data for some reason).
         This provides more data when we are trying to predict dates (like last div payout date) that yFinance doesn't provide.
          
         Args:
-            dividends: Historical ex-dividend payment series
+            dividends: Historical ex-dividend payment series, or its DividendArrays
+            now: Today's date, defaults to date.today()
             
         Returns:
             ExDividendPattern containing statistical metrics about payment timing
         """
         
         try:
-            if dividends.empty:
+            # too few samples overall means too few recent ones, skip the index conversion
+            if len(dividends) < DividendPatternAnalyzer.MIN_SAMPLES_REQUIRED:
                 return ExDividendPattern(0, 0, 0, 0)
+            
+            arrays = _as_arrays(dividends)
                 
-            recent_cutoff = pd.Timestamp.now() - pd.Timedelta(days=DividendPatternAnalyzer.RECENT_HISTORY_DAYS)
-            dates_index = pd.DatetimeIndex(dividends.index).tz_localize(None)
-            recent_dividends = dividends[dates_index >= recent_cutoff]
+            today = now or date.today()
+            recent_cutoff = today.toordinal() - EPOCH_ORDINAL - DividendPatternAnalyzer.RECENT_HISTORY_DAYS
+            # history is sorted, so recent dates are a tail slice instead of a boolean mask copy
+            recent_ordinals = arrays.ordinals[np.searchsorted(arrays.ordinals, recent_cutoff, side='left'):]
             
-            if len(recent_dividends) < DividendPatternAnalyzer.MIN_SAMPLES_REQUIRED:
-                if len(dividends) < DividendPatternAnalyzer.MIN_SAMPLES_REQUIRED:
-                    return ExDividendPattern(0, 0, 0, 0)
-                recent_dividends = dividends
+            if len(recent_ordinals) < DividendPatternAnalyzer.MIN_SAMPLES_REQUIRED:
+                recent_ordinals = arrays.ordinals
             
-            days = np.array([DateNormalizer.normalize_date(d).day 
-                           for d in recent_dividends.index])
+            # day of month = days since the start of that month + 1
+            dates = recent_ordinals.astype('datetime64[D]')
+            days = (dates - dates.astype('datetime64[M]')).astype(np.int64) + 1
             
-               
-            return ExDividendPattern(
-                mean_day_of_month=float(np.mean(days)),
-                std_dev_days=float(np.std(days, ddof=1)),
-                min_day=int(np.min(days)),
-                max_day=int(np.max(days)))
+            return ExDividendPattern.from_days(days)
             
         except Exception as e:
-            print(f"Pattern analysis failed: {str(e)}")
+            logger.warning("Pattern analysis failed: %s", e)
             return ExDividendPattern(0, 0, 0, 0)
 
 
@@ -248,7 +391,7 @@ class DividendPatternAnalyzer:
     @classmethod
     def predict_future_dates(cls, gap_days: int, avg_interval: float, last_ex_date: Optional[date],
             calendar: Optional[Dict] = None, pattern: Optional[ExDividendPattern] = None,
-            payout_timing: str = DividendFrequency.QUARTERLY) -> Optional[List[str]]:
+            payout_timing: str = DividendFrequency.QUARTERLY, now: Optional[date] = None) -> Optional[List[str]]:
         """
         Predict future dividend payment dates for 1+ year period. 
         
@@ -256,9 +399,10 @@ class DividendPatternAnalyzer:
             gap_days: Days between ex-dividend and payment
             avg_interval: Average days between payments
             last_ex_date: Last known ex-dividend date
-            calendar: Optional upcoming dividend calendar
+            calendar: Optional upcoming dividend calendar, raw or from normalize_calendar
             pattern: Historical timing patterns
             payout_timing: Expected dividend frequency
+            now: Today's date, defaults to date.today()
             
         Returns:
             List of ISO format predicted payment dates or None if insufficient data
@@ -269,46 +413,26 @@ class DividendPatternAnalyzer:
         if not last_ex_date or avg_interval <= 0:
             return None
             
-        future_dates = []
-        today = date.today()
+        today = now or date.today()
         
         
         # Check calendar for guaranteed next divident payout date if available
-        if calendar and isinstance(calendar, dict):
-            div_date = calendar.get("Dividend Date")
-            ex_date = calendar.get("Ex-Dividend Date")
-            
-            if isinstance(div_date, (date, datetime, pd.Timestamp)) and \
-            isinstance(ex_date, (date, datetime, pd.Timestamp)):
-                
-                div_date = DateNormalizer.normalize_date(div_date)
-                ex_date = DateNormalizer.normalize_date(ex_date)
-                
-                if div_date >= today:
-                    future_dates.append(div_date.isoformat())
-                    last_known_date = div_date
-                    
-                    # project remaining dates starting with confirmed next date
-                    for i in range(1, num_loops):
-                        next_date = last_known_date + timedelta(days=int(round(avg_interval)))
-                        future_dates.append(next_date.isoformat())
-                        last_known_date = next_date
-                        
-                    return future_dates
+        calendar = cls.normalize_calendar(calendar)
+        div_date = calendar["Dividend Date"]
+        
+        if div_date is not None and calendar["Ex-Dividend Date"] is not None:
+            if div_date >= today:
+                # project remaining dates starting with confirmed next date, all projected as day ordinals at once
+                payouts = div_date.toordinal() + np.arange(num_loops) * int(round(avg_interval))
+                return [date.fromordinal(int(payout)).isoformat() for payout in payouts]
         
         # begin projection from last ex-dividend date if no confirmed date
-        last_known_date = last_ex_date
+        # project the NEXT ex-dividend dates, payout will likely be gap_days AFTER each ex-dividend date
+        offsets = np.rint(np.arange(1, num_loops + 1) * avg_interval).astype(np.int64) + int(gap_days)
+        payouts = last_ex_date.toordinal() + offsets
         
-        for i in range(1, num_loops + 1):
-            # project NEXT ex-dividend date
-            next_ex = last_known_date + timedelta(days=int(round(avg_interval * i)))
-            
-            # payout will likely be gap_days AFTER the ex-dividend date
-            next_payout = next_ex + timedelta(days=gap_days)
-            
-            # ensure it is a future date, thats the whole point!
-            if next_payout >= today: 
-                future_dates.append(next_payout.isoformat())
+        # ensure they are future dates, thats the whole point!
+        future_dates = [date.fromordinal(int(payout)).isoformat() for payout in payouts[payouts >= today.toordinal()]]
                 
         return future_dates if future_dates else None
 
@@ -320,7 +444,7 @@ class DividendPatternAnalyzer:
     @staticmethod
     def get_latest_ex_date(info: Dict[str, Any],
                            calendar: Dict,
-                           dividends: pd.Series) -> Optional[str]:
+                           dividends: Union[pd.Series, DividendArrays]) -> Optional[str]:
         """
 
             
@@ -333,18 +457,17 @@ class DividendPatternAnalyzer:
 
         Args:
             info: Stock information dictionary
-            calendar: Calendar data with upcoming dates
-            dividends: Historical dividend series
+            calendar: Calendar data with upcoming dates, raw or from normalize_calendar
+            dividends: Historical dividend series, or its DividendArrays
             
         Returns:
             ISO format date string or None if no valid date found
         """
         
         # try calendar first for best data
-        if calendar and isinstance(calendar, dict):
-            cal_ex_date = calendar.get("Ex-Dividend Date")
-            if isinstance(cal_ex_date, date):
-                return cal_ex_date.isoformat()
+        cal_ex_date = DividendPatternAnalyzer.normalize_calendar(calendar)["Ex-Dividend Date"]
+        if cal_ex_date is not None:
+            return cal_ex_date.isoformat()
         
         # next try info dict for possible date
         ex_div_timestamp = info.get('exDividendDate')
@@ -353,11 +476,12 @@ class DividendPatternAnalyzer:
                 ex_date = datetime.fromtimestamp(ex_div_timestamp, tz=timezone.utc).date()
                 return ex_date.isoformat()
             except Exception as e:
-                print(f"Failed to parse exDividendDate: {e}")
+                logger.warning("Failed to parse exDividendDate: %s", e)
         
         # fallback to the (ex-)dividends  list and take the latest
-        if not dividends.empty:
-            return dividends.index[-1].date().isoformat()
+        arrays = _as_arrays(dividends)
+        if not arrays.empty:
+            return arrays.date_at(-1).isoformat()
         
         return None
     
@@ -366,9 +490,9 @@ class DividendPatternAnalyzer:
 
 
     @staticmethod
-    def get_last_dividend_info(dividends: pd.Series, calendar: Dict, gap_days: int,
+    def get_last_dividend_info(dividends: Union[pd.Series, DividendArrays], calendar: Dict, gap_days: int,
                                avg_interval: float, pattern: ExDividendPattern,
-                               staleness_threshold: float) -> Dict[str, Optional[float | str]]:
+                               staleness_threshold: float, now: Optional[date] = None) -> Dict[str, Optional[float | str]]:
         """
         
         Get the date and dollar amount for the last dividend payout. The date is a few days off in some cases.
@@ -383,12 +507,13 @@ class DividendPatternAnalyzer:
             - Adjust final date forward or backward if it is in the future or it is too old
  
         Args:
-            dividends: Historical dividend series
-            calendar: Dividend calendar data
+            dividends: Historical dividend series, or its DividendArrays
+            calendar: Dividend calendar data, raw or from normalize_calendar
             gap_days: Ex-dividend to payment gap
             avg_interval: Average days between payments
             pattern: Historical timing patterns
             staleness_threshold: Threshold for stale data detection
+            now: Today's date, defaults to date.today()
             
         Returns:
             Dictionary containing:
@@ -397,52 +522,48 @@ class DividendPatternAnalyzer:
             - estimation_method: Method used to determine values
         """
         try:
-            if dividends.empty:
+            arrays = _as_arrays(dividends)
+            if arrays.empty:
                 return {
                     "date": None,
                     "amount": None,
                     "estimation_method": "no_dividend_history"
                 }
             
-            today = date.today()
+            today = now or date.today()
             pattern_info = (f"[pattern: mean_day={pattern.mean_day_of_month:.1f}, "
                           f"std={pattern.std_dev_days:.1f}, "
                           f"threshold={staleness_threshold:.2f}]")
             
-            last_ex_div = DateNormalizer.normalize_date(dividends.index[-1])
-            last_amount = float(dividends.iloc[-1])
+            last_ex_div = arrays.date_at(-1)
+            last_amount = float(arrays.amounts[-1])
             
-            if calendar and isinstance(calendar, dict):
-                cal_div_date = calendar.get("Dividend Date")
-                cal_ex_date = calendar.get("Ex-Dividend Date")
-                
-                if isinstance(cal_div_date, (date, datetime, pd.Timestamp)) and \
-                   isinstance(cal_ex_date, (date, datetime, pd.Timestamp)):
-                    
-                    cal_div_date = DateNormalizer.normalize_date(cal_div_date)
-                    cal_ex_date = DateNormalizer.normalize_date(cal_ex_date)
-                    # days since the last dividend was paid out
-                    days_since_cal = (today - cal_div_date).days
-                    # if the number of days since the last payout is more than usual, 
-                    # and a staleness_threshold to determine if this is uncharacteristic of them
-                    if days_since_cal > avg_interval * staleness_threshold:
-                        estimated_div_date = cal_div_date + timedelta(days=int(avg_interval))
-                        if estimated_div_date <= today:
-                            return {
-                                "date": estimated_div_date.isoformat(),
-                                "amount": last_amount,
-                                "estimation_method": f"calendar_date_plus_one_interval"
-                            }
-                    # calendar data is JUST stale enough that it is exactly the last dividend data
-                    elif cal_div_date < today:
+            calendar = DividendPatternAnalyzer.normalize_calendar(calendar)
+            cal_div_date = calendar["Dividend Date"]
+            
+            if cal_div_date is not None and calendar["Ex-Dividend Date"] is not None:
+                # days since the last dividend was paid out
+                days_since_cal = (today - cal_div_date).days
+                # if the number of days since the last payout is more than usual, 
+                # and a staleness_threshold to determine if this is uncharacteristic of them
+                if days_since_cal > avg_interval * staleness_threshold:
+                    estimated_div_date = date.fromordinal(cal_div_date.toordinal() + int(avg_interval))
+                    if estimated_div_date <= today:
                         return {
-                            "date": cal_div_date.isoformat(),
+                            "date": estimated_div_date.isoformat(),
                             "amount": last_amount,
-                            "estimation_method": f"direct_from_calendar"
+                            "estimation_method": f"calendar_date_plus_one_interval"
                         }
-            
+                # calendar data is JUST stale enough that it is exactly the last dividend data
+                elif cal_div_date < today:
+                    return {
+                        "date": cal_div_date.isoformat(),
+                        "amount": last_amount,
+                        "estimation_method": f"direct_from_calendar"
+                    }
+        
             # The estimated payout date is the last reported ex-div date + the usual gap
-            estimated_payout = last_ex_div + timedelta(days=gap_days)
+            estimated_payout = date.fromordinal(last_ex_div.toordinal() + int(gap_days))
 
             # handle cases where estimated last div date is too old, predicted into the future, or just right
             days_since_estimated = (today - estimated_payout).days
@@ -450,7 +571,7 @@ class DividendPatternAnalyzer:
             # case where estimated payout is one cycle too old 
             # the average payout interval is added to get the last dividend date
             if days_since_estimated > avg_interval * staleness_threshold:
-                projected_date = estimated_payout + timedelta(days=int(avg_interval))
+                projected_date = date.fromordinal(estimated_payout.toordinal() + int(avg_interval))
                 if projected_date <= today:
                     return {
                         "date": projected_date.isoformat(),
@@ -461,10 +582,10 @@ class DividendPatternAnalyzer:
             # case where the new date is now in the future 
             # retry with the second last ex-dividend date
             if estimated_payout > today or days_since_estimated > avg_interval * staleness_threshold:
-                if len(dividends) > 1:
-                    prev_ex_div = DateNormalizer.normalize_date(dividends.index[-2])
-                    prev_amount = float(dividends.iloc[-2])
-                    prev_estimated_payout = prev_ex_div + timedelta(days=gap_days)
+                if len(arrays) > 1:
+                    prev_ex_div = arrays.date_at(-2)
+                    prev_amount = float(arrays.amounts[-2])
+                    prev_estimated_payout = date.fromordinal(prev_ex_div.toordinal() + int(gap_days))
                     
                     if prev_estimated_payout <= today:
                         return {
@@ -489,10 +610,82 @@ class DividendPatternAnalyzer:
             }
             
         except Exception as e:
-            print(f"Dividend info calculation failed: {str(e)}")
+            logger.warning("Dividend info calculation failed: %s", e)
             return {
                 "date": None,
                 "amount": None,
                 "estimation_method": f"error_during_processing: {str(e)}"
             }
+    
+
+
+
+
+    @classmethod
+    def analyze_many(cls, items: Dict[str, pd.Series], chunk_size: int = 64,
+                     max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the calendar-independent analysis for many tickers at once.
+        
+        Dividend histories are converted to DividendArrays up front and split into chunks of 
+        chunk_size tickers, each chunk is analyzed in a worker process. Chunking matters, 
+        sending tickers one at a time would cost more in process overhead than the analysis itself.
+        A batch that fits in a single chunk is analyzed in this process.
+
+        Note: on platforms that spawn worker processes (Windows, macOS) the calling script needs 
+        an `if __name__ == "__main__":` guard.
+
+        Args:
+            items: Dictionary mapping symbols to their historical ex-dividend series
+            chunk_size: Number of tickers analyzed per worker task
+            max_workers: Max number of worker processes, defaults to the number of CPUs
+            
+        Returns:
+            Dict mapping symbols to dictionaries containing:
+            - frequency: Payment frequency (monthly/quarterly/etc)
+            - average_interval: Average days between dividend payouts
+            - pattern: Historical ex-dividend date pattern metrics
+            - staleness_threshold: Data freshness threshold
+        """
+        arrays = [(symbol, DividendArrays.from_series(dividends)) for symbol, dividends in items.items()]
+        chunks = [arrays[i:i + chunk_size] for i in range(0, len(arrays), chunk_size)]
+        
+        # read the clock once so the whole batch is analyzed against the same day
+        analyze_chunk = partial(_analyze_chunk, now=date.today())
+        
+        if len(chunks) <= 1:
+            return dict(analyze_chunk(arrays))
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_results in executor.map(analyze_chunk, chunks):
+                results.update(chunk_results)
+        return results
+
 
+
+
+def _analyze_chunk(chunk: List[Tuple[str, DividendArrays]], now: date) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Worker for DividendPatternAnalyzer.analyze_many, analyzes one chunk of tickers.
+
+    Kept at module level so it can be pickled and sent to worker processes.
+    """
+    results = []
+    for symbol, arrays in chunk:
+        frequency, avg_interval = DividendPatternAnalyzer.analyze_dividend_frequency(arrays, now)
+        pattern = DividendPatternAnalyzer.analyze_ex_dividend_patterns(arrays, now)
+        results.append((symbol, {
+            "frequency": frequency,
+            "average_interval": avg_interval,
+            "pattern": pattern
+        }))
+    
+    # staleness thresholds for the whole chunk in one vectorized call
+    thresholds = DividendPatternAnalyzer.calculate_staleness_threshold_batch(
+        np.array([result["average_interval"] or 0.0 for _, result in results]),
+        np.array([result["pattern"].std_dev_days for _, result in results])
+    )
+    for (_, result), threshold in zip(results, thresholds):
+        result["staleness_threshold"] = float(threshold) if result["average_interval"] else 1.1
+    return results
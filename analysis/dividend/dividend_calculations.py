@@ -1,8 +1,8 @@
 # src\analysis\dividend\dividend_calculations.py
 
 from typing import Optional, Dict, Any, Tuple
+import numpy as np
 import pandas as pd
-from utils.get_redundant_field import get_redundant_field
 from models.dividend_models import DividendFrequency
 
 
@@ -41,8 +41,13 @@ class DividendCalculator:
             return float(rate), "direct_from_info"
             
         # Method 2: Price * Yield if available
-        if price and (yield_value := get_redundant_field(info, "dividendYield", ["yield"])):
-            return round(price * yield_value, 4), "price_and_yield_product"
+        # only one alias, so two plain lookups instead of the get_redundant_field loop,
+        # first value that is not None like get_redundant_field so a 0 yield isn't skipped
+        yield_value = info.get("dividendYield")
+        if yield_value is None:
+            yield_value = info.get("yield")
+        if price and yield_value is not None:
+            return round(price * float(yield_value), 4), "price_and_yield_product"
             
         # Method 3 fallback hail mary: Calculate from history based on frequency
         if not dividends.empty and frequency is not None:
@@ -123,10 +128,12 @@ class DividendCalculator:
             return None
             
         n_payments = DividendFrequency.get_payments_needed(frequency)
-        recent_year = recent_divs.tail(n_payments)
+        # slice the underlying buffer, pandas tail() + sum() is much slower for a handful of values
+        recent_year = recent_divs.to_numpy(copy=False)[-n_payments:]
         
-        if len(recent_year) > 0:
-            annual_rate = float(recent_year.sum() * (n_payments / len(recent_year)))
+        if n := recent_year.size:
+            # nansum matches Series.sum(), which skips missing values
+            annual_rate = float(np.nansum(recent_year) * (n_payments / n))
             return round(annual_rate, 4)
         
         return None
@@ -1,14 +1,22 @@
-from dataclasses import dataclass
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass, asdict, InitVar
+from functools import cached_property, partial
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, ClassVar, Tuple, Callable, Iterable
 import pandas as pd
 from datetime import date
 from analysis.dividend.dividend_calculations import DividendCalculator
-from data.yfinance_adapter import yFinanceAdapter
+from data.yfinance_adapter import yFinanceAdapter, shared_adapter
 from analysis.dividend.dividend_analysis import DividendPatternAnalyzer
-from models.dividend_models import ExDividendPattern, DividendGapResult
+from models.dividend_models import ExDividendPattern, DividendGapResult, DividendArrays
 from utils.date_util import DateNormalizer
 from utils.get_redundant_field import get_redundant_field
-from services.ticker_cache import use_cache
+from services.ticker_cache import StockCache, use_cache
+
+logger = logging.getLogger(__name__)
+
+# the analyzer holds no per-ticker state, so every TickerResearch uses this one
+_ANALYZER = DividendPatternAnalyzer()
 
 @dataclass
 class TickerResearch:
@@ -19,25 +27,51 @@ class TickerResearch:
     All ticker operations go through this class to maintain consistent access patterns.
     """
     symbol: str
+    # True when the caller already looked the symbol up in StockCache and missed (TickerBatchResearch),
+    # so use_cache skips its own lookup and goes straight to fetching
+    cache_checked: InitVar[bool] = False
+    
+    # set once _analyze_patterns has filled in the analysis results
+    _analyzed: ClassVar[bool] = False
+    # shared analyzer, kept on the class so it isn't pickled into the cache with every ticker
+    _analyzer: ClassVar[DividendPatternAnalyzer] = _ANALYZER
+    
+    # (get_basic_info field, Yahoo Finance info key) pairs, in output order
+    _BASIC_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("name", "longName"),
+        ("short_name", "shortName"),
+        ("symbol", "underlyingSymbol"),
+        ("underlying_symbol", "underlyingSymbol"),
+        ("legal_type", "legalType"),
+        ("sector", "sector"),
+        ("industry", "industry"),
+        ("currency", "currency"),
+        ("market_cap", "marketCap"),
+        ("fund_family", "fundFamily"),
+        ("exchange", "exchange"),
+        ("quote_type", "quoteType")
+    )
     
     
     @use_cache
-    def __post_init__(self):
+    def __post_init__(self, cache_checked: bool = False):
         """
-        Initialize components and perform analysis on ticker.
+        Fetch data for the ticker, analysis is deferred until first needed.
         
-        Sets up market data connection, analyzer, and cache handling.
+        Market data and analysis go through the process wide adapter and analyzer.
         Caching behavior controlled by @use_cache decorator.
         """
         
-        self._market_data = yFinanceAdapter()
-        self._analyzer = DividendPatternAnalyzer()
-        
-        # fetch raw data
+        # fetch raw data, dividend analysis runs on first use (see _ensure_analyzed)
         self._fetch_data()
-        
-        # core dividend analysis
-        self._analyze_patterns()
+
+
+
+    
+    @property
+    def _market_data(self) -> yFinanceAdapter:
+        """Shared adapter, one for all tickers instead of one per TickerResearch"""
+        return shared_adapter()
 
 
 
@@ -50,6 +84,8 @@ class TickerResearch:
         Stores error info if an operation fails.
 
         There exists more data beyond info/calendar/dividends, but it is not relevant to this project
+        The shared adapter's memo for the symbol only lives for this fetch, so caching (and turning it 
+        off or clearing it) stays up to StockCache
         """
         try:
             self.info: Dict[str, Any] = self._market_data.get_stock_info(self.symbol)
@@ -61,20 +97,80 @@ class TickerResearch:
             self.calendar = {}
             self.dividends = pd.Series(dtype=float)
             self.error = str(e)
+        finally:
+            self._market_data.forget(self.symbol)
+
+
+
+    
+    @cached_property
+    def _dividend_arrays(self) -> DividendArrays:
+        """Dividend history converted once, shared by every analyzer call"""
+        return DividendArrays.from_series(self.dividends)
+
+
+
+    
+    @cached_property
+    def _normalized_calendar(self) -> Dict[str, Optional[date]]:
+        """Calendar dates normalized once, shared by every analyzer call"""
+        return self._analyzer.normalize_calendar(self.calendar)
+
+
+
+    
+    def _ensure_analyzed(self) -> None:
+        """
+        Run the dividend pattern analysis if it has not run yet for this instance.
+
+        Price-only uses (e.g. get_all_prices) never reach this, so they skip the analysis entirely.
+        """
+        if not self._analyzed:
+            self._analyze_patterns()
+            self._analyzed = True
+
+
+
+    
+    @cached_property
+    def _frequency(self) -> Optional[str]:
+        self._ensure_analyzed()
+        return self.__dict__["_frequency"]
+
+    @cached_property
+    def _avg_interval(self) -> Optional[float]:
+        self._ensure_analyzed()
+        return self.__dict__["_avg_interval"]
+
+    @cached_property
+    def _gap_result(self) -> DividendGapResult:
+        self._ensure_analyzed()
+        return self.__dict__["_gap_result"]
+
+    @cached_property
+    def _pattern(self) -> ExDividendPattern:
+        self._ensure_analyzed()
+        return self.__dict__["_pattern"]
+
+    @cached_property
+    def _staleness(self) -> float:
+        self._ensure_analyzed()
+        return self.__dict__["_staleness"]
 
 
 
     
     def _analyze_patterns(self) -> None:
         """
-        Perform initial analysis of dividend patterns.
+        Perform analysis of dividend patterns.
         
         Calculates/estimates frequency, gaps, and statistical patterns.
         Sets defaults for all metrics if analysis fails.
+        Results are stored on the instance, replacing the lazy properties above.
         """
         try:
             # dividend analysis
-            self._frequency, self._avg_interval = self._analyzer.analyze_dividend_frequency(self.dividends)
+            self._frequency, self._avg_interval = self._analyzer.analyze_dividend_frequency(self._dividend_arrays)
             
             # case no dividends
             if self._avg_interval is None:
@@ -84,8 +180,8 @@ class TickerResearch:
                 return
                 
             # analysis for dividend paying stocks
-            self._gap_result = self._analyzer.analyze_dividend_gap(self.calendar, self._avg_interval)
-            self._pattern = self._analyzer.analyze_ex_dividend_patterns(self.dividends)
+            self._gap_result = self._analyzer.analyze_dividend_gap(self._normalized_calendar, self._avg_interval)
+            self._pattern = self._analyzer.analyze_ex_dividend_patterns(self._dividend_arrays)
             
             self._staleness = (
             self._analyzer.calculate_staleness_threshold(
@@ -94,7 +190,7 @@ class TickerResearch:
             ) if self._avg_interval else 1.1
         )
         except Exception as e:
-            print(f"Analysis failed for {self.symbol}: {str(e)}")
+            logger.warning("Analysis failed for %s: %s", self.symbol, e)
             self._frequency = None
             self._avg_interval = None
             self._gap_result = DividendGapResult(0, False, "analysis_failed")
@@ -237,8 +333,8 @@ class TickerResearch:
         return {
             "frequency": self._frequency,
             "average_interval": self._avg_interval,
-            "gap_result": self._gap_result.__dict__,
-            "pattern": self._pattern.__dict__,
+            "gap_result": asdict(self._gap_result),
+            "pattern": asdict(self._pattern),
             "staleness_threshold": self._staleness
         }
 
@@ -255,7 +351,16 @@ class TickerResearch:
             - dividend_date: Next dividend payment date if available
             - ex_dividend_date: Next ex-dividend date if available
             Both None if calendar data unavailable
+            The same dict is returned on every call, treat it as read only
         """
+        return self.calendar_dates
+
+
+
+    
+    @cached_property
+    def calendar_dates(self) -> Dict[str, Optional[date]]:
+        """Normalized upcoming calendar dates, built once (see get_calendar_dates)"""
         if not self.calendar:
             return {
                 "dividend_date": None,
@@ -295,6 +400,18 @@ class TickerResearch:
 
 
     
+    @cached_property
+    def price(self) -> Optional[float]:
+        """Current stock price, looked up once since info doesn't change after fetching"""
+        return get_redundant_field(
+            data=self.info, 
+            primary_key="currentPrice", 
+            backup_keys=["regularMarketPrice", "previousClose"]
+            )
+
+
+
+    
     def get_price(self) -> Optional[float]:
         """
         Get current stock price.
@@ -302,11 +419,7 @@ class TickerResearch:
         Returns:
             float: Current price of a stock or None if data is not available
         """
-        return get_redundant_field(
-            data=self.info, 
-            primary_key="currentPrice", 
-            backup_keys=["regularMarketPrice", "previousClose"]
-            )
+        return self.price
     
 
 
@@ -331,23 +444,21 @@ class TickerResearch:
             - quote_type
             - price
             Values are "?" if they could not be found
+            The same dict is returned on every call, treat it as read only
         """
+        return self.basic_info
+
+
+
+    
+    @cached_property
+    def basic_info(self) -> Dict[str, Any]:
+        """Standardized basic info fields, built once (see get_basic_info)"""
         fallback = "?"
-        return {
-            "name": self.info.get("longName", fallback),
-            "short_name": self.info.get("shortName", fallback),
-            "symbol": self.info.get("underlyingSymbol", fallback),
-            "underlying_symbol": self.info.get("underlyingSymbol", fallback),
-            "legal_type": self.info.get("legalType", fallback),
-            "sector": self.info.get("sector", fallback),
-            "industry": self.info.get("industry", fallback),
-            "currency": self.info.get("currency", fallback),
-            "market_cap": self.info.get("marketCap", fallback),
-            "fund_family": self.info.get("fundFamily", fallback),
-            "exchange": self.info.get("exchange", fallback),
-            "quote_type": self.info.get("quoteType", fallback),
-            "price": self.get_price()
-        }
+        info = self.info
+        basic_info = {field: info.get(key, fallback) for field, key in self._BASIC_FIELDS}
+        basic_info["price"] = self.price
+        return basic_info
 
 
 
@@ -366,9 +477,18 @@ class TickerResearch:
             - calculation_methods
                 - dividend_rate_method: Method used to calculate the dividend rate
                 - payout_ratio_method: Method used to calculate the payout ratio
+            The same dict is returned on every call, treat it as read only
         """
+        return self.dividend_info
+
+
+
+    
+    @cached_property
+    def dividend_info(self) -> Dict[str, Any]:
+        """Dividend rates, yields and payment patterns, calculated once (see get_dividend_info)"""
         # base price for calculations
-        price = self.get_price()
+        price = self.price
         
         # calculate dividend rate
         div_rate, rate_method = DividendCalculator.calculate_dividend_rate(
@@ -390,7 +510,7 @@ class TickerResearch:
             "payout_ratio": payout_ratio if payout_ratio else fallback,
             "frequency": self._frequency,
             "average_interval_days": int(round(self._avg_interval)) if self._avg_interval else fallback,
-            "ex_dividend_date": self._analyzer.get_latest_ex_date( self.info, self.calendar, self.dividends ),
+            "ex_dividend_date": self._analyzer.get_latest_ex_date( self.info, self._normalized_calendar, self._dividend_arrays ),
             "calculation_methods": {
                 "dividend_rate_method": rate_method,
                 "payout_ratio_method": ratio_method
@@ -411,8 +531,8 @@ class TickerResearch:
             - estimation_method: Method used to estimate last dividend date
         """
         return self._analyzer.get_last_dividend_info(
-            self.dividends,
-            self.calendar,
+            self._dividend_arrays,
+            self._normalized_calendar,
             self._gap_result.gap_days,
             self._avg_interval,
             self._pattern,
@@ -435,8 +555,8 @@ class TickerResearch:
         return self._analyzer.predict_future_dates(
             gap_days=self._gap_result.gap_days,
             avg_interval=self._avg_interval,
-            last_ex_date=self.dividends.index[-1].date(),
-            calendar=self.calendar,
+            last_ex_date=self._dividend_arrays.date_at(-1),
+            calendar=self._normalized_calendar,
             pattern=self._pattern,
             payout_timing=self._frequency or "quarterly"
         )
@@ -487,18 +607,50 @@ class TickerResearch:
 class TickerBatchResearch:
     """Handles batch processing of multiple tickers"""
     
+    __slots__ = ("tickers",)
     
-    def __init__(self, symbols: List[str]):
+    # upper limit on concurrent ticker fetches, more than this gets rate limited (429) by Yahoo quickly
+    MAX_THREADS = 8
+    
+    # get_all request name -> TickerResearch accessor, results are keyed in this order
+    ACCESSORS: Dict[str, Callable[[TickerResearch], Any]] = {
+        "price": TickerResearch.get_price,
+        "basic_info": TickerResearch.get_basic_info,
+        "dividend_info": TickerResearch.get_dividend_info,
+        "future_dates": TickerResearch.get_future_dates,
+        "status": TickerResearch.get_status,
+        "gap_analysis": TickerResearch.get_gap_analysis
+    }
+    
+    
+    def __init__(self, symbols: List[str], threads: Optional[int] = None):
         """
         Initialize TickerResearch objects for multiple tickers.
         
+        Cached tickers are loaded together in one cache query. Fetching the rest is almost 
+        entirely waiting on Yahoo Finance, so they are fetched concurrently on a small thread pool.
+        
         Args:
             symbols: List of ticker symbols to retrieve
+            threads: Max number of tickers fetched at once (capped at MAX_THREADS), 1 fetches serially.
+                     None uses MAX_THREADS
         """
-        self.tickers: Dict[str, TickerResearch] = {
-            symbol.upper(): TickerResearch(symbol)
-            for symbol in symbols
-        }
+        # one fetch per unique symbol, the last spelling of a repeated symbol wins like a dict would
+        cached, missing = StockCache().partition(symbols)
+        workers = max(1, min(threads or self.MAX_THREADS, self.MAX_THREADS, len(missing)))
+        
+        if workers == 1:
+            fetched = [TickerResearch(symbol, cache_checked=True) for symbol in missing]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(partial(TickerResearch, cache_checked=True), missing))
+        
+        # keys laid out first so the batch keeps the order symbols were given, filling them in doesn't reorder
+        tickers: Dict[str, TickerResearch] = dict.fromkeys(symbol.upper() for symbol in symbols)
+        tickers.update(cached)
+        for symbol, ticker in zip(missing, fetched):
+            tickers[symbol.upper()] = ticker
+        self.tickers = tickers
 
 
 
@@ -525,7 +677,41 @@ class TickerBatchResearch:
         Returns:
             Optional[TickerResearch]: TickerResearch object if found, None otherwise
         """
-        return self.tickers.get(symbol.upper())
+        return self._get_raw(symbol.upper())
+
+
+
+    
+    def _get_raw(self, key: str) -> Optional[TickerResearch]:
+        """Look up a ticker by an already uppercase symbol, skipping the normalization in get_ticker"""
+        return self.tickers.get(key)
+
+
+
+    
+    def get_all(self, requests: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several kinds of results for all tickers in a single pass over the batch.
+        
+        Args:
+            requests: Names from ACCESSORS to collect for each ticker, e.g. {"price", "status"}
+            
+        Returns:
+            Dict mapping symbols to dicts of the requested results, keyed by request name
+            
+        Raises:
+            ValueError: If a request name is not in ACCESSORS
+        """
+        requests = set(requests)
+        unknown = requests.difference(self.ACCESSORS)
+        if unknown:
+            raise ValueError(f"Unknown get_all request(s): {', '.join(sorted(unknown))}")
+        
+        getters = [(name, getter) for name, getter in self.ACCESSORS.items() if name in requests]
+        return {
+            symbol: {name: getter(ticker) for name, getter in getters}
+            for symbol, ticker in self.tickers.items()
+        }
 
 
 
@@ -637,4 +823,4 @@ class TickerBatchResearch:
             Optional[TickerResearch]: TickerResearch object if found,
                                     None if symbol not in batch
         """
-        return self.tickers.get(symbol.upper())
\ No newline at end of file
+        return self._get_raw(symbol.upper())
\ No newline at end of file
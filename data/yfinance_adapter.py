@@ -1,12 +1,133 @@
 # src\data\yfinance_adapter.py
 
-from typing import Dict, Any, Optional
-import yfinance as yf
+from typing import Dict, Any, Optional, TYPE_CHECKING
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from pathlib import Path
 from requests import Session
+from requests.adapters import HTTPAdapter
+from requests_cache import CacheMixin, SQLiteCache
+from requests_ratelimiter import LimiterMixin, MemoryQueueBucket
+from pyrate_limiter import Duration, RequestRate, Limiter
+import numpy as np
 import pandas as pd
 from utils.retry_util import smart_retry
 from utils.ignore_warnings import silence_yfinance_warnings
 from utils.exceptions import yFinanceError
+from utils.get_redundant_field import get_redundant_field
+
+if TYPE_CHECKING:
+    import yfinance as yf
+
+logger = logging.getLogger(__name__)
+
+# Yahoo Finance API hosts that yFinance sends requests to
+_YAHOO_HOSTS = ("https://query1.finance.yahoo.com", "https://query2.finance.yahoo.com")
+
+# raw HTTP responses are cached next to the ticker cache
+_HTTP_CACHE_PATH = Path.home() / '.cache' / 'stock_info' / 'yf_http.cache'
+_HTTP_CACHE_DURATION = timedelta(hours=1)
+
+# Yahoo's request budget (60/min, 360/hour, 8000/day), one bucket for all Yahoo hosts,
+# shared by the default session and adapters with a custom session
+_YF_BUCKET = 'yfinance'
+_YF_LIMITER = Limiter(
+    RequestRate(60, Duration.MINUTE),
+    RequestRate(360, Duration.HOUR),
+    RequestRate(8000, Duration.DAY),
+    bucket_class=MemoryQueueBucket
+)
+
+_session: Optional[Session] = None
+_session_lock = threading.Lock()
+
+_adapter: Optional["yFinanceAdapter"] = None
+_adapter_lock = threading.Lock()
+
+# yfinance module once imported, it takes a few hundred ms to import so it waits until a ticker is needed
+_yf = None
+
+
+
+def _yfinance():
+    """Get the yfinance module, importing it on first use"""
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
+
+
+class CachedLimiterSession(CacheMixin, LimiterMixin, Session):
+    """
+    Session that caches responses and throttles requests to Yahoo Finance.
+    
+    Requests are delayed before Yahoo starts answering with 429s, instead of the retry loop 
+    burning through the quota. Cached responses don't count towards the rate limit.
+    """
+
+    def _bucket_name(self, request) -> str:
+        """Every request, whichever Yahoo host it goes to, draws from the one shared bucket"""
+        return _YF_BUCKET
+
+
+
+def _shared_session() -> Session:
+    """
+    Get the process wide Session shared by every adapter, creating it on first use.
+    
+    Reusing one Session keeps connections to Yahoo alive between requests, 
+    so only the first request to each host pays for the TCP/TLS handshake.
+    The pool is sized for the concurrent fetches in TickerBatchResearch.
+    
+    Requests are limited to 60 per minute, 360 per hour and 8000 per day in total across the Yahoo hosts 
+    (and any adapters throttling with a custom session), and responses 
+    are cached in SQLite for an hour so repeated lookups don't hit Yahoo again.
+    
+    Returns:
+        Session: Shared cached, rate limited session with pooled connections to the Yahoo hosts
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                session = CachedLimiterSession(
+                    limiter=_YF_LIMITER,
+                    per_host=False,
+                    backend=SQLiteCache(str(_HTTP_CACHE_PATH)),
+                    expire_after=_HTTP_CACHE_DURATION
+                )
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, pool_block=False)
+                for host in _YAHOO_HOSTS:
+                    session.mount(host, adapter)
+                _session = session
+    return _session
+
+
+
+def shared_adapter() -> "yFinanceAdapter":
+    """
+    Get the process wide adapter shared by every TickerResearch, creating it on first use.
+    
+    TickerResearch forgets its symbol from the memo once its fetch is done, so repeat lookups 
+    go through StockCache (and honor it being disabled or cleared) instead of this memo.
+    
+    Returns:
+        yFinanceAdapter: Shared adapter using the shared session
+    """
+    global _adapter
+    if _adapter is None:
+        with _adapter_lock:
+            if _adapter is None:
+                _adapter = yFinanceAdapter()
+    return _adapter
+
+
 
 class yFinanceAdapter():
     """
@@ -21,14 +142,124 @@ class yFinanceAdapter():
 
     """
     
+    # max number of yf.Ticker objects (and their info dicts) kept in memory per adapter
+    MAX_MEMO_TICKERS = 256
+    # seconds a memoized yf.Ticker (and its info) is reused before it is downloaded again, same as the HTTP cache
+    MEMO_TTL_SECONDS = _HTTP_CACHE_DURATION.total_seconds()
+    
     def __init__(self, session: Optional[Session] = None):
         """
         Initialize adapter with optional custom session.
         
         Args:
-            session: Optional requests Session for customized request handling
+            session: Optional requests Session for customized request handling, 
+                     defaults to a cached, rate limited Session shared by all adapters
+        """
+        self.session = session if session is not None else _shared_session()
+        
+        # yf.Ticker objects by uppercase symbol, least recently used first
+        self._tickers: OrderedDict[str, "yf.Ticker"] = OrderedDict()
+        # ticker.info by uppercase symbol, for symbols in self._tickers
+        self._info: Dict[str, Dict[str, Any]] = {}
+        # time.monotonic() each memoized ticker was created, for MEMO_TTL_SECONDS
+        self._ticker_times: Dict[str, float] = {}
+        # guards the memos when one adapter is shared between threads
+        self._memo_lock = threading.Lock()
+
+
+
+
+    def __getstate__(self) -> Dict[str, Any]:
         """
-        self.session = session
+        Leave the shared session, the ticker memo and its lock out of pickles.
+        
+        Adapters get cached along with TickerResearch, and the yf.Ticker objects hold onto a lot of raw data.
+        """
+        state = self.__dict__.copy()
+        if state.get("session") is _session:
+            state["session"] = None
+        state["_tickers"] = OrderedDict()
+        state["_info"] = {}
+        state["_ticker_times"] = {}
+        state.pop("_memo_lock", None)
+        return state
+
+
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Reattach the shared session and a new memo lock when unpickled"""
+        self.__dict__.update(state)
+        if self.session is None:
+            self.session = _shared_session()
+        # adapters pickled before the memo existed
+        self.__dict__.setdefault("_tickers", OrderedDict())
+        self.__dict__.setdefault("_info", {})
+        self.__dict__.setdefault("_ticker_times", {})
+        self._memo_lock = threading.Lock()
+
+
+
+
+    def _get_ticker(self, symbol: str) -> "yf.Ticker":
+        """
+        Get the memoized yFinance ticker for a symbol, creating it on first use.
+        
+        yf.Ticker caches what it downloads, so reusing one object per symbol means info, 
+        dividends and calendar are each fetched from Yahoo once.
+        
+        Args:
+            symbol: Stock ticker symbol
+            
+        Returns:
+            yf.Ticker: Ticker object for the symbol
+        """
+        key = symbol.upper()
+        with self._memo_lock:
+            ticker = self._tickers.get(key)
+            if ticker is not None:
+                if time.monotonic() - self._ticker_times[key] < self.MEMO_TTL_SECONDS:
+                    self._tickers.move_to_end(key)
+                    return ticker
+                # expired, forget the ticker and its info so both are downloaded again
+                self._forget(key)
+        
+        # created outside the lock, the retries can sleep
+        ticker = self._fetch_ticker(symbol)
+        with self._memo_lock:
+            # keep the ticker another thread may have stored meanwhile, so the data is only downloaded once
+            if key in self._tickers:
+                ticker = self._tickers[key]
+            else:
+                self._tickers[key] = ticker
+                self._ticker_times[key] = time.monotonic()
+            self._tickers.move_to_end(key)
+            if len(self._tickers) > self.MAX_MEMO_TICKERS:
+                self._forget(next(iter(self._tickers)))
+        return ticker
+
+
+
+
+    def _forget(self, key: str) -> None:
+        """Drop a symbol from every memo, caller must hold _memo_lock"""
+        self._tickers.pop(key, None)
+        self._info.pop(key, None)
+        self._ticker_times.pop(key, None)
+
+
+
+
+
+    def forget(self, symbol: str) -> None:
+        """
+        Drop a symbol's memoized yf.Ticker and info, so the next lookup downloads them again.
+        
+        Args:
+            symbol: Stock ticker symbol
+        """
+        with self._memo_lock:
+            self._forget(symbol.upper())
 
 
 
@@ -37,7 +268,7 @@ class yFinanceAdapter():
         max_tries=3,
         allowed_exceptions=(yFinanceError,)
     )
-    def _fetch_ticker(self, symbol: str) -> yf.Ticker:
+    def _fetch_ticker(self, symbol: str) -> "yf.Ticker":
         """
         Create yFinance ticker instance with retry handling.
         
@@ -53,7 +284,23 @@ class yFinanceAdapter():
         Raises:
             yFinanceError: When ticker cannot be fetched after retries
         """
-        return yf.Ticker(symbol, session=self.session)
+        return _yfinance().Ticker(symbol, session=self.session)
+
+
+
+
+    def _throttle(self) -> None:
+        """
+        Block until the shared request budget allows another call to Yahoo.
+        
+        The default session already throttles every HTTP request it sends, this covers adapters 
+        created with a custom session so they can't burst past Yahoo's limits and into the retry loop.
+        yf.Ticker() itself doesn't send anything, so this runs right before the data is accessed.
+        """
+        if isinstance(self.session, LimiterMixin):
+            return
+        with _YF_LIMITER.ratelimit(_YF_BUCKET, delay=True):
+            pass
 
 
 
@@ -73,8 +320,63 @@ class yFinanceAdapter():
         Returns:
             Dict containing stock information or empty dict if fetch fails
         """
-        ticker = self._fetch_ticker(symbol)
-        return ticker.info or {}
+        key = symbol.upper()
+        # checks the memo TTL, the info memo is only valid while its ticker is memoized
+        ticker = self._get_ticker(symbol)
+        info = self._info.get(key)
+        if info is None:
+            self._throttle()
+            info = ticker.info or {}
+            with self._memo_lock:
+                # skip if the ticker was evicted or replaced while fetching, so _info stays in step with _tickers
+                if self._tickers.get(key) is ticker:
+                    self._info[key] = info
+        return info
+
+
+
+
+    def get_basic_info_fast(self, symbol: str, include_profile: bool = False) -> Dict[str, Any]:
+        """
+        Get a few basic quote fields without the full stock info request.
+        
+        ticker.info goes through Yahoo's quoteSummary endpoint, which is the request that gets 
+        rate limited (429) most often. ticker.fast_info covers price, exchange, currency and market cap 
+        from cheaper endpoints. Name, sector and industry only exist in the full info.
+        Uses the full info instead if it was already fetched for this symbol.
+        
+        Args:
+            symbol: Stock ticker symbol
+            include_profile: Also get name, sector and industry (fetches the full info)
+            
+        Returns:
+            Dict with price, exchange, currency and market_cap (plus name, sector and industry 
+            if include_profile), values are None if unavailable
+        """
+        key = symbol.upper()
+        if include_profile or key in self._info:
+            info = self.get_stock_info(symbol)
+            basic = {
+                "price": get_redundant_field(info, "currentPrice", ["regularMarketPrice", "previousClose"]),
+                "exchange": info.get("exchange"),
+                "currency": info.get("currency"),
+                "market_cap": info.get("marketCap")
+            }
+            if include_profile:
+                basic.update(name=info.get("longName"), sector=info.get("sector"), industry=info.get("industry"))
+            return basic
+        
+        ticker = self._get_ticker(symbol)
+        self._throttle()
+        fast_info = ticker.fast_info
+        basic = {}
+        for field, attr in (("price", "last_price"), ("exchange", "exchange"), 
+                            ("currency", "currency"), ("market_cap", "market_cap")):
+            try:
+                basic[field] = fast_info[attr]
+            except Exception:
+                basic[field] = None
+        return basic
 
 
 
@@ -92,9 +394,35 @@ class yFinanceAdapter():
         Returns:
             Series containing ex-dividend history, sorted by date
         """
-        ticker = self._fetch_ticker(symbol)
+        ticker = self._get_ticker(symbol)
+        self._throttle()
         dividends = ticker.dividends
-        return dividends.sort_index() if dividends is not None else pd.Series(dtype=float)
+        if dividends is None:
+            return pd.Series(dtype=float)
+        # yFinance already returns the history in ascending order, only sort if it isn't
+        if dividends.index.is_monotonic_increasing:
+            return dividends
+        return dividends.sort_index(kind='mergesort')
+
+
+
+
+    def get_exdiv_days_of_month(self, symbol: str) -> np.ndarray:
+        """
+        Get the day of the month of every historical ex-dividend date.
+        
+        Pulled out of the index in one vectorized step, ready for ExDividendPattern.from_days.
+        
+        Args:
+            symbol: Stock ticker symbol
+            
+        Returns:
+            int16 array of days (1-31) in date order, empty for non-dividend stocks
+        """
+        dividends = self.get_dividend_history(symbol)
+        if dividends.empty:
+            return np.empty(0, dtype=np.int16)
+        return pd.DatetimeIndex(dividends.index).day.to_numpy(dtype=np.int16)
 
 
 
@@ -113,11 +441,12 @@ class yFinanceAdapter():
         Returns:
             Dict containing calendar data or empty dict if unavailable
         """
-        ticker = self._fetch_ticker(symbol)
+        ticker = self._get_ticker(symbol)
+        self._throttle()
         try:
             if hasattr(ticker, '_calendar'):
                 return ticker._calendar or {}
             return ticker.calendar or {}
         except Exception as e:
-            print(f"Warning: Error fetching calendar for {symbol}: {str(e)}")
+            logger.warning("Error fetching calendar for %s: %s", symbol, e)
             return {}
\ No newline at end of file
@@ -4,6 +4,11 @@ from api.ticker_research import TickerResearch, TickerBatchResearch
 from services.ticker_cache import StockCache
 from utils.data_printer import print_data
 from datetime import timedelta
+import logging
+
+# show the cache's fetch timing messages (logged at debug level), used by the cache demonstration
+logging.basicConfig(format="%(message)s")
+logging.getLogger("services.ticker_cache").setLevel(logging.DEBUG)
 
 
 
@@ -1,6 +1,11 @@
 from api.ticker_research import TickerResearch
 from utils.data_printer import print_data
 from datetime import timedelta
+import logging
+
+# show the cache's fetch timing messages (logged at debug level)
+logging.basicConfig(format="%(message)s")
+logging.getLogger("services.ticker_cache").setLevel(logging.DEBUG)
 
 # Optional: Use cache
 from services.ticker_cache import StockCache
@@ -1,17 +1,26 @@
 # src/models/dividend_models.py
-from dataclasses import dataclass
-from typing import Optional, Dict, ClassVar, Literal
+from dataclasses import dataclass, fields
+from bisect import bisect_right
+from datetime import date
+from typing import Optional, Dict, ClassVar, Literal, Tuple, List
+import numpy as np
+import pandas as pd
+
+# date.toordinal() of the unix epoch, converts numpy day counts to python dates
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
-@dataclass
 class DividendFrequency:
     """
     Constants and utilities for dividend payment frequencies.
     
     Provides standardized frequency names, payment calculations,
     and interval ranges for analyzing dividend payment patterns.
+    Only holds class level constants, it is never instantiated.
     """
     
+    __slots__ = ()
+    
     # standardized frequency names
     MONTHLY: ClassVar[str] = "monthly"
     QUARTERLY: ClassVar[str] = "quarterly"
@@ -59,10 +68,74 @@ class DividendFrequency:
             int: Number of payments per year or None if invalid
         """
         return cls.PAYMENTS_PER_YEAR.get(frequency)
+    
+    @classmethod
+    def classify(cls, days: float) -> str:
+        """
+        Classify an average interval between ex-dividend dates.
+        
+        Args:
+            days: Average number of days between ex-dividend dates
+            
+        Returns:
+            str: Frequency name, "unknown" if the interval is outside of every range
+        """
+        # same lookup as classify_batch, on plain lists since bisect beats NumPy for one value
+        lowers, uppers = _INTERVAL_BOUNDS
+        i = bisect_right(lowers, days) - 1
+        if i < 0 or not days < uppers[i]:
+            return "unknown"
+        return INTERVAL_TABLE[2][i]
+    
+    @classmethod
+    def classify_batch(cls, intervals: np.ndarray) -> np.ndarray:
+        """
+        Map many average intervals to their frequency at once.
+        
+        Args:
+            intervals: Average days between payments, one per ticker
+            
+        Returns:
+            np.ndarray: Object array of frequency names, "unknown" where no range matches
+        """
+        lowers, uppers, labels = INTERVAL_TABLE
+        intervals = np.asarray(intervals, dtype=np.float64)
+        idx = np.searchsorted(lowers, intervals, side='right') - 1
+        valid = (idx >= 0) & (intervals < uppers[np.maximum(idx, 0)])
+        
+        result = np.full(intervals.shape, "unknown", dtype=object)
+        result[valid] = np.asarray(labels, dtype=object)[idx[valid]]
+        return result
+
 
+# INTERVAL_RANGES as sorted (lowers, uppers, labels), so intervals can be bucketed with np.searchsorted
+INTERVAL_TABLE: Tuple[np.ndarray, np.ndarray, Tuple[str, ...]] = (
+    np.asarray([lower for (lower, _), _ in sorted(DividendFrequency.INTERVAL_RANGES.items())], dtype=np.float32),
+    np.asarray([upper for (_, upper), _ in sorted(DividendFrequency.INTERVAL_RANGES.items())], dtype=np.float32),
+    tuple(freq for _, freq in sorted(DividendFrequency.INTERVAL_RANGES.items()))
+)
 
 
-@dataclass
+# INTERVAL_TABLE bounds as plain lists for DividendFrequency.classify
+_INTERVAL_BOUNDS: Tuple[List[float], List[float]] = (INTERVAL_TABLE[0].tolist(), INTERVAL_TABLE[1].tolist())
+
+
+def _slots_setstate(self, state) -> None:
+    """
+    Restore a pickled slots dataclass.
+    
+    Pickles from before the result classes used slots hold a {field: value} dict 
+    instead of the field value tuple that dataclass pickles with slots=True.
+    """
+    if isinstance(state, dict):
+        state = tuple(state[f.name] for f in fields(self))
+    for f, value in zip(fields(self), state):
+        # frozen, so set through object
+        object.__setattr__(self, f.name, value)
+
+
+
+@dataclass(slots=True, frozen=True)
 class DividendGapResult:
     """
     Analysis result for gap between ex-dividend and payment dates.
@@ -73,9 +146,11 @@ class DividendGapResult:
     confidence: Literal["high", "moderate", "low"] # confidence level based on estimation method
     estimation_method: str # specific method used to estimate the gap
 
+    __setstate__ = _slots_setstate
 
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExDividendPattern:
     """
     Statistical analysis of historical ex-dividend dates.
@@ -87,3 +162,86 @@ class ExDividendPattern:
     min_day: int # earliest observed ex-div date
     max_day: int # latest observed ex-div date
 
+    __setstate__ = _slots_setstate
+
+    @classmethod
+    def from_days(cls, days: np.ndarray) -> "ExDividendPattern":
+        """
+        Build the pattern from ex-dividend days of the month.
+        
+        Args:
+            days: Day of the month (1-31) of each ex-dividend date, at least 2 values
+            
+        Returns:
+            ExDividendPattern with the mean, sample std dev, min and max day
+        """
+        return cls(
+            mean_day_of_month=float(days.mean(dtype=np.float64)),
+            std_dev_days=float(days.std(dtype=np.float64, ddof=1)),
+            min_day=int(days.min()),
+            max_day=int(days.max()))
+
+
+
+@dataclass(frozen=True, eq=False)
+class DividendArrays:
+    """
+    Ex-dividend history stored as plain NumPy arrays.
+    
+    Built once per ticker so the analyzer can work with integer/float arrays 
+    instead of re-parsing the pandas index in every method.
+    """
+    ordinals: np.ndarray # ex-dividend dates as int64 days since epoch (exchange local dates)
+    amounts: np.ndarray # dividend amount paid for each ex-dividend date
+
+    @classmethod
+    def from_series(cls, dividends: pd.Series) -> "DividendArrays":
+        """
+        Convert a dividend series from yFinance into arrays.
+        
+        Args:
+            dividends: Time series of dividend payments with dates as index
+            
+        Returns:
+            DividendArrays with one entry per dividend, in the same order as the series
+        """
+        index = dividends.index
+        if not isinstance(index, pd.DatetimeIndex):
+            index = pd.DatetimeIndex(index)
+        
+        # raw integer timestamps in the index's own unit, no new index is built
+        stamps = index.asi8
+        if index.tz is not None:
+            # the local wall time is the actual ex-div date, so shift by the utc offset
+            offset = index.tz.utcoffset(None)
+            if offset is None:
+                # DST zone, the offset changes across the history so let pandas resolve it per timestamp
+                stamps = index.tz_localize(None).asi8
+            else:
+                stamps = stamps + np.timedelta64(offset) // np.timedelta64(1, index.unit)
+        
+        per_day = np.timedelta64(1, 'D') // np.timedelta64(1, index.unit)
+        return cls(
+            ordinals=stamps // per_day,
+            amounts=dividends.to_numpy(dtype=np.float64)
+        )
+
+    @property
+    def empty(self) -> bool:
+        """True if there is no dividend history"""
+        return len(self.ordinals) == 0
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def date_at(self, i: int) -> date:
+        """
+        Get the ex-dividend date at position i as a python date.
+        
+        Args:
+            i: Position in the history, negative values count from the end
+            
+        Returns:
+            date: Ex-dividend date
+        """
+        return date.fromordinal(EPOCH_ORDINAL + int(self.ordinals[i]))
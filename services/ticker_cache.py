@@ -1,30 +1,110 @@
 # src\services\ticker_cache.py
 
+import logging
 import pickle
 import sqlite3
+import struct
 import threading
-from datetime import datetime, timedelta
+import time
+import weakref
+from datetime import timedelta
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Tuple
 from functools import wraps
+import zstandard as zstd
+
+logger = logging.getLogger(__name__)
+
+# first byte of each cache entry, entries written before compression start with a raw pickle instead
+_ZSTD_MAGIC = b'\x01' # zstd compressed pickle
+_FRAMED_MAGIC = b'\x02' # zstd compressed pickle with out-of-band buffers, see _serialize
+_ZSTD_LEVEL = 3
+
+# bumped whenever the ticker_cache table or the cached objects change, stored in the database as PRAGMA user_version.
+# older databases are emptied rather than converted, version 1 still held pickles from before the slots dataclasses
+_SCHEMA_VERSION = 2
+
+# max symbols bound into a single IN (...) query, well under SQLite's host parameter limit
+_MAX_QUERY_SYMBOLS = 500
+
+
+
+def _serialize(obj: Any) -> bytes:
+    """
+    Pickle and compress an object for storage.
+    
+    Cached tickers hold the full info dict and dividend history, which compress several times over.
+    Pickle protocol 5 hands NumPy/pandas buffers over out-of-band, so they are streamed into the 
+    compressor as is instead of being copied into the pickle first. The decompressed layout is:
+    
+        header_len | header pickle | n buffers | n buffer lengths | raw buffers
+    
+    A new compressor is created per call because compressor objects can't be shared between threads.
+    """
+    buffers = []
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    
+    compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+    chunks = [
+        _FRAMED_MAGIC,
+        compressor.compress(struct.pack('<I', len(header))),
+        compressor.compress(header),
+        compressor.compress(struct.pack(f'<I{len(raws)}Q', len(raws), *(raw.nbytes for raw in raws)))
+    ]
+    chunks.extend(compressor.compress(raw) for raw in raws)
+    chunks.append(compressor.flush())
+    return b''.join(chunks)
+
+
+
+def _deserialize(data: bytes) -> Any:
+    """Load an object stored by _serialize, or an older compressed/uncompressed pickle"""
+    kind = data[:1]
+    if kind == _ZSTD_MAGIC:
+        return pickle.loads(zstd.decompress(memoryview(data)[1:]))
+    if kind != _FRAMED_MAGIC:
+        return pickle.loads(data)
+    
+    # bytearray so the arrays rebuilt on top of the buffers are writable
+    raw = bytearray(zstd.ZstdDecompressor().decompressobj().decompress(memoryview(data)[1:]))
+    view = memoryview(raw)
+    
+    (header_len,) = struct.unpack_from('<I', raw, 0)
+    header = view[4:4 + header_len]
+    offset = 4 + header_len
+    (n_buffers,) = struct.unpack_from('<I', raw, offset)
+    lengths = struct.unpack_from(f'<{n_buffers}Q', raw, offset + 4)
+    offset += 4 + 8 * n_buffers
+    
+    buffers = []
+    for length in lengths:
+        buffers.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(header, buffers=buffers)
+
+
 
 class StockCache:
     """
     Thread-safe singleton cache manager for TickerResearch objects.
 
-    Uses SQLite for persistent storage with pickle serialization.
+    Uses SQLite for persistent storage with zstd compressed pickle serialization.
     Significantly improves performance by avoiding repeated Yahoo Finance API calls.
     """
     
     _instance = None
+    _initialized = False
     _lock = threading.Lock()
     
     def __new__(cls):
         """Ensure single cache instance using double-checked locking pattern"""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-            return cls._instance
+        # the lock is only taken while the instance doesn't exist yet
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
     
     def __init__(self):
         """
@@ -33,13 +113,40 @@ class StockCache:
         Only runs on first instantiation due to singleton pattern.
         Creates cache directory and SQLite database if they don't exist!
         """
-        if not hasattr(self, 'initialized'):
+        if StockCache._initialized:
+            return
+        with StockCache._lock:
+            if StockCache._initialized:
+                return
             self.cache_dir = Path.home() / '.cache' / 'stock_info'
             self.db_path = self.cache_dir / 'ticker_cache.db'
             self.cache_enabled = True
             self.cache_duration = timedelta(hours=24)
-            self.initialized = True
+            self._tls = threading.local()
+            # tickers still alive in this process by uppercase symbol, and the time each was cached,
+            # so re-creating a ticker doesn't need another database read + unpickle
+            self._live: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+            self._live_times: Dict[str, float] = {}
             self._init_db()
+            # set last, other threads wait on the lock until the database is ready
+            StockCache._initialized = True
+    
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the cache database, opening it on first use.
+        
+        Connections stay open for the life of the thread instead of reconnecting on every call.
+        WAL mode lets the threads of a batch read while another thread is writing.
+        """
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._tls.conn = conn
+        return conn
     
     def _init_db(self):
         """
@@ -47,18 +154,39 @@ class StockCache:
         
         Creates ticker_cache table if it doesn't exist with:
         - symbol: Unique ticker symbol (PRIMARY KEY)
-        - data: Pickled TickerResearch object
-        - timestamp: ISO format cache timestamp
+        - data: Compressed pickle of the TickerResearch object
+        - timestamp: Cache time in epoch seconds
+        
+        Databases from an older schema version (or from before it was tracked) are only a cache 
+        of data that can be fetched again, so their entries are dropped instead of converted.
         """
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._conn()
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version >= _SCHEMA_VERSION:
+            return
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # another process may have migrated while this one waited for the write lock
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version >= _SCHEMA_VERSION:
+                conn.execute("COMMIT")
+                return
+            
+            conn.execute("DROP TABLE IF EXISTS ticker_cache")
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS ticker_cache (
+                CREATE TABLE ticker_cache (
                     symbol TEXT PRIMARY KEY,
                     data BLOB NOT NULL,
-                    timestamp TEXT NOT NULL
+                    timestamp INTEGER NOT NULL
                 )
             """)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
     
     def enable(self):
         """Enable cache for future TickerResearch fetching and retrieval"""
@@ -77,6 +205,28 @@ class StockCache:
         """
         self.cache_duration = duration
     
+    def _track(self, symbol: str, ticker_object: Any, cached_at: Optional[float] = None) -> None:
+        """
+        Remember a live ticker object for a symbol.
+        
+        Args:
+            symbol: Stock ticker symbol
+            ticker_object: TickerResearch obj holding the cached data
+            cached_at: Epoch seconds the data was cached, None keeps the time already tracked
+        """
+        key = symbol.upper()
+        self._live[key] = ticker_object
+        if cached_at is not None:
+            self._live_times[key] = cached_at
+    
+    def _recall(self, key: str, cutoff: float) -> Optional[Any]:
+        """Get the live ticker object for an uppercase symbol if it was cached at or after cutoff"""
+        ticker_object = self._live.get(key)
+        if ticker_object is None:
+            self._live_times.pop(key, None)
+            return None
+        return ticker_object if self._live_times.get(key, 0) >= cutoff else None
+    
     def clear(self) -> bool:
         """
         Clear all cached data from database.
@@ -85,11 +235,13 @@ class StockCache:
             bool: True if successfully cleared, False if error
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM ticker_cache")
+            conn = self._conn()
+            conn.execute("DELETE FROM ticker_cache")
+            self._live.clear()
+            self._live_times.clear()
             return True
         except Exception as e:
-            print(f"Error clearing cache: {e}")
+            logger.warning("Error clearing cache: %s", e)
             return False
     
     def get(self, symbol: str) -> Optional[Any]:
@@ -110,30 +262,86 @@ class StockCache:
             return None
             
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT data, timestamp FROM ticker_cache WHERE symbol = ?",
-                    (symbol.upper(),)
-                )
-                result = cursor.fetchone()
-                
-                if result:
-                    data, timestamp = result
-                    cache_time = datetime.fromisoformat(timestamp)
-                    
-                    if datetime.now() - cache_time < self.cache_duration:
-                        return pickle.loads(data)
-                        
-                    # delete data if it has been cached longer than self.cache_duration
-                    conn.execute(
-                        "DELETE FROM ticker_cache WHERE symbol = ?",
-                        (symbol.upper(),)
-                    )
+            # expired entries are filtered out here and purged on the next set()
+            key = symbol.upper()
+            cutoff = int(time.time() - self.cache_duration.total_seconds())
+            if (live := self._recall(key, cutoff)) is not None:
+                return live
+            
+            result = self._conn().execute(
+                "SELECT data, timestamp FROM ticker_cache WHERE symbol = ? AND timestamp >= ?",
+                (key, cutoff)
+            ).fetchone()
+            if not result:
                 return None
+            
+            ticker_object = _deserialize(result[0])
+            self._track(key, ticker_object, result[1])
+            return ticker_object
         except Exception as e:
-            print(f"Error retrieving from cache: {e}")
+            logger.warning("Error retrieving from cache: %s", e)
             return None
     
+    def get_many(self, symbols: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve all valid cached tickers for a list of symbols with one query.
+        
+        Args:
+            symbols: Stock ticker symbols
+            
+        Returns:
+            Dict mapping uppercase symbols to cached TickerResearch objects. Symbols that are 
+            not cached or expired are left out, and the dict is empty if the cache is disabled or any error occurs
+        """
+        if not self.cache_enabled or not symbols:
+            return {}
+            
+        try:
+            cutoff = int(time.time() - self.cache_duration.total_seconds())
+            found = {}
+            unread = []
+            for key in dict.fromkeys(symbol.upper() for symbol in symbols):
+                if (live := self._recall(key, cutoff)) is not None:
+                    found[key] = live
+                else:
+                    unread.append(key)
+            
+            for start in range(0, len(unread), _MAX_QUERY_SYMBOLS):
+                chunk = unread[start:start + _MAX_QUERY_SYMBOLS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn().execute(
+                    f"SELECT symbol, data, timestamp FROM ticker_cache WHERE symbol IN ({placeholders}) AND timestamp >= ?",
+                    (*chunk, cutoff)
+                )
+                for symbol, data, timestamp in rows:
+                    try:
+                        found[symbol] = _deserialize(data)
+                    except Exception:
+                        # pickled from an older version of the cached classes, treat it as a miss
+                        continue
+                    self._track(symbol, found[symbol], timestamp)
+            return found
+        except Exception as e:
+            logger.warning("Error retrieving from cache: %s", e)
+            return {}
+    
+    def partition(self, symbols: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Split a batch of symbols into cached tickers and symbols that still need fetching.
+        
+        Args:
+            symbols: Stock ticker symbols, repeats are only returned once
+            
+        Returns:
+            Tuple of (hits, misses):
+                - hits: Dict mapping uppercase symbols to cached TickerResearch objects
+                - misses: Symbols that are not cached or expired, as given (last spelling of a repeat), in input order
+        """
+        unique = {symbol.upper(): symbol for symbol in symbols}
+        hits = self.get_many(list(unique))
+        misses = [symbol for key, symbol in unique.items() if key not in hits]
+        return hits, misses
+    
     def set(self, symbol: str, ticker_object: Any) -> bool:
         """
         Cache a ticker object with the current timestamp.
@@ -149,22 +357,29 @@ class StockCache:
             return False
             
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                serialized_data = pickle.dumps(ticker_object)
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO ticker_cache (symbol, data, timestamp)
-                    VALUES (?, ?, ?)
-                    """,
-                    (
-                        symbol.upper(),
-                        serialized_data,
-                        datetime.now().isoformat()
-                    )
+            conn = self._conn()
+            serialized_data = _serialize(ticker_object)
+            now = int(time.time())
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO ticker_cache (symbol, data, timestamp)
+                VALUES (?, ?, ?)
+                """,
+                (
+                    symbol.upper(),
+                    serialized_data,
+                    now
                 )
+            )
+            # drop entries that have been cached longer than self.cache_duration
+            conn.execute(
+                "DELETE FROM ticker_cache WHERE timestamp < ?",
+                (int(now - self.cache_duration.total_seconds()),)
+            )
+            self._track(symbol, ticker_object, now)
             return True
         except Exception as e:
-            print(f"Error caching data: {e}")
+            logger.warning("Error caching data: %s", e)
             return False
 
 def use_cache(func):
@@ -172,34 +387,38 @@ def use_cache(func):
     Decorator to handle caching for TickerResearch initialization.
     
     Wraps initialization of all new TickerResearch object to:
-    1. First check cache before expensive data fetching
+    1. First check cache before expensive data fetching, unless the caller passes cache_checked=True 
+       because it already found the symbol missing (e.g. with StockCache.partition)
     2. Update cache after fresh data fetch
-    3. Monitor and report performance timing to emphasize the benefit of caching
+    3. Monitor and log (at debug level) performance timing to emphasize the benefit of caching
     """
     @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        import time
-        start_time = time.time()
+    def wrapper(self, cache_checked: bool = False):
+        start_time = time.perf_counter()
+        # StockCache() waits for another thread still initializing the singleton, its fast path is lock free after that
         cache = StockCache()
         
-        if cache.cache_enabled:
+        if cache.cache_enabled and not cache_checked:
             cached_ticker = cache.get(self.symbol)
             if cached_ticker is not None:
-                # copy cached data to self in order to use
-                self.__dict__.update(cached_ticker.__dict__)
-                elapsed = time.time() - start_time
-                print(f"- Fetched cached data for {self.symbol.upper()} in {elapsed:.2f}s")
+                # take over the cached object's attributes by reference instead of copying them,
+                # then track self so the next ticker for this symbol can reuse them as well
+                self.__dict__ = cached_ticker.__dict__
+                del cached_ticker
+                cache._track(self.symbol, self)
+                elapsed = time.perf_counter() - start_time
+                logger.debug("Fetched cached data for %s in %.2fs", self.symbol.upper(), elapsed)
                 return
         
         # no cache hit if we are here, so proceed with normal init and fetch fresh data
-        func(self, *args, **kwargs)
+        func(self, cache_checked)
         
         # now cache fresh data we just grabbed
         if cache.cache_enabled:
             cache.set(self.symbol, self)
         
         # elapsed time should be considerably longer
-        elapsed = time.time() - start_time
-        print(f"- Fetched fresh data for {self.symbol.upper()} in {elapsed:.2f}s")
+        elapsed = time.perf_counter() - start_time
+        logger.debug("Fetched fresh data for %s in %.2fs", self.symbol.upper(), elapsed)
             
     return wrapper
\ No newline at end of file
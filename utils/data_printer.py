@@ -1,6 +1,8 @@
 # src/utils/data_printer.py
 
-from typing import Any, Dict, Optional
+import sys
+from io import StringIO
+from typing import Any, Callable, Dict, Optional
 from datetime import datetime, date
 
 class DictPrinter:
@@ -9,41 +11,58 @@ class DictPrinter:
     def __init__(self, indent_size: int = 2, max_line_length: int = 100):
         self.indent_size = indent_size
         self.max_line_length = max_line_length
+        # indent prefix per nesting level, extended on demand by _indent
+        self._indents = [""]
+
+    # formatter per value type, anything not listed (or a subclass of a listed type) is resolved in format_value
+    _FORMATTERS: Dict[type, Callable[[Any], str]] = {
+        float: lambda v: f"{v:.4f}",
+        int: str,
+        bool: str,
+        str: str,
+        type(None): str,
+        datetime: lambda v: v.isoformat(),
+        date: lambda v: v.isoformat()
+    }
 
     def format_value(self, value: Any) -> str:
-        if value is None:
-            return "None"
-        elif isinstance(value, (float, int)):
-            if isinstance(value, float):
-                return f"{value:.4f}"
-            return str(value)
-        elif isinstance(value, (datetime, date)):
-            return value.isoformat()
-        elif isinstance(value, bool):
-            return str(value)
-        return str(value)
+        formatters = self._FORMATTERS
+        value_type = type(value)
+        fn = formatters.get(value_type)
+        if fn is None:
+            # subclasses (np.float64, pd.Timestamp, ...) use the closest listed base type
+            fn = next((formatters[base] for base in value_type.__mro__ if base in formatters), str)
+            formatters[value_type] = fn
+        return fn(value)
 
     def print_dict(self, data: Dict[str, Any], title: Optional[str] = None) -> None:
+        buf = StringIO()
         if title:
-            print(f"\n{title}")
-            print("=" * len(title))
+            buf.write(f"\n{title}\n{'=' * len(title)}\n")
         
-        self._print_dict_content(data)
+        self._print_dict_content(data, buf)
+        # one write for the whole dict instead of a print per line
+        sys.stdout.write(buf.getvalue())
+
+    def _indent(self, level: int) -> str:
+        indents = self._indents
+        while len(indents) <= level:
+            indents.append("-" * (len(indents) * self.indent_size))
+        return indents[level]
 
-    def _print_dict_content(self, data: Dict[str, Any], level: int = 0) -> None:
-        indent = "-" * (level * self.indent_size)
+    def _print_dict_content(self, data: Dict[str, Any], buf: StringIO, level: int = 0) -> None:
+        indent = self._indent(level)
         
-        max_key_length = max(len(str(k)) for k in data.keys()) + 3
+        # stringify each key once, for both the width and the output line
+        keys = [str(k) for k in data]
+        max_key_length = max(map(len, keys), default=0) + 3
         
-        for key, value in data.items():
+        for key, value in zip(keys, data.values()):
             if isinstance(value, dict):
-                print(f"{indent}{str(key)}:")
-                self._print_dict_content(value, level + 1)
+                buf.write(f"{indent}{key}:\n")
+                self._print_dict_content(value, buf, level + 1)
             else:
-                formatted_value = self.format_value(value)
-                padding = " " * (max_key_length - len(str(key)))
-                print(f"{indent}{str(key)}{padding}: {formatted_value}")
-
+                buf.write(f"{indent}{key:<{max_key_length}}: {self.format_value(value)}\n")
 
 def print_data(data: Dict[str, Any], title: Optional[str] = None, indent: int = 2) -> None:
     """
@@ -3,7 +3,29 @@
 from datetime import date, datetime
 import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Union, Optional, Any, Iterable
+from functools import lru_cache
+
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(dt: Union[datetime, pd.Timestamp, date, np.datetime64], dt_type: type, tzinfo: Optional[Any]) -> date:
+    """
+    Cached conversion for DateNormalizer.normalize_date.
+    
+    dt_type and tzinfo are only part of the cache key. Equal values of different types 
+    (Timestamp and datetime) or the same instant in different timezones compare and hash 
+    equal, but can have a different local date.
+    """
+    if isinstance(dt, (datetime, pd.Timestamp)):
+        return dt.date()
+    if isinstance(dt, date):
+        return dt
+    if isinstance(dt, np.datetime64):
+        return pd.Timestamp(dt).date()
+    raise ValueError(f"Unsupported date type: {type(dt)}")
+
+
 
 class DateNormalizer:
     """
@@ -33,12 +55,30 @@ class DateNormalizer:
             ValueError: If input type cannot be converted to date
         """
         try:
-            if isinstance(dt, (datetime, pd.Timestamp)):
-                return dt.date()
-            if isinstance(dt, date):
-                return dt
-            if isinstance(dt, np.datetime64):
-                return pd.Timestamp(dt).date()
-            raise ValueError(f"Unsupported date type: {type(dt)}")
+            # errors aren't cached, so unsupported input raises every time
+            return _normalize_cached(dt, type(dt), getattr(dt, "tzinfo", None))
         except Exception as e:
             raise ValueError(f"Date normalization failed for {dt} of type {type(dt)}: {str(e)}")
+
+    @staticmethod
+    def normalize_dates(dts: Union[pd.DatetimeIndex, pd.Series, np.ndarray, Iterable]) -> np.ndarray:
+        """
+        Convert many date-like objects to standard Python date objects at once.
+        
+        Vectorized version of normalize_date, the conversion runs inside pandas 
+        instead of a Python loop over the values. Timezone aware input keeps its local dates.
+        
+        Args:
+            dts: DatetimeIndex, datetime64 array, or any sequence of dates that pandas can parse
+            
+        Returns:
+            np.ndarray: Object array of date objects, in the same order as the input
+            
+        Raises:
+            ValueError: If the input cannot be converted to dates
+        """
+        try:
+            index = dts if isinstance(dts, pd.DatetimeIndex) else pd.DatetimeIndex(dts)
+            return index.date
+        except Exception as e:
+            raise ValueError(f"Date normalization failed for input of type {type(dts)}: {str(e)}")
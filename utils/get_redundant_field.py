@@ -17,8 +17,9 @@ def get_redundant_field(data: Dict, primary_key: str, backup_keys: List[str]
     Returns:
         float value if found, None if no valid value exists
     """
-    if value := data.get(primary_key): return float(value)
-    for key in backup_keys:
-        if value := data.get(key):
+    # compare against None so a legitimate 0 is returned instead of skipped
+    for key in (primary_key, *backup_keys):
+        value = data.get(key)
+        if value is not None:
             return float(value)
     return None
\ No newline at end of file
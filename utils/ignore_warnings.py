@@ -1,6 +1,13 @@
 import logging
+import threading
 from functools import wraps
 
+# number of calls currently silencing yfinance, and the level to restore when the last one finishes.
+# the yfinance logger is process global, so overlapping calls on different threads share one save/restore
+_silence_lock = threading.Lock()
+_silence_depth = 0
+_saved_level = logging.NOTSET
+
 
 def silence_yfinance_warnings(func):
     """
@@ -8,14 +15,24 @@ def silence_yfinance_warnings(func):
     
     Calendar data requests often return 404s for stocks without calendar info.
     This is expected behavior that doesn't need to spam the console.
+    
+    Safe to use from several threads at once, the original level is restored
+    when the last overlapping call finishes.
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
+        global _silence_depth, _saved_level
         yf_logger = logging.getLogger('yfinance')
-        original_level = yf_logger.level
-        yf_logger.setLevel(logging.CRITICAL + 1)
+        with _silence_lock:
+            if _silence_depth == 0:
+                _saved_level = yf_logger.level
+                yf_logger.setLevel(logging.CRITICAL + 1)
+            _silence_depth += 1
         try:
             return func(*args, **kwargs)
         finally:
-            yf_logger.setLevel(original_level)
+            with _silence_lock:
+                _silence_depth -= 1
+                if _silence_depth == 0:
+                    yf_logger.setLevel(_saved_level)
     return wrapper
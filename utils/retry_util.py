@@ -2,8 +2,6 @@
 from typing import Type, Union, Callable
 import functools
 import backoff
-import random
-from utils.exceptions import yFinanceError
 
 def smart_retry(
     max_tries: int = 3,
@@ -26,33 +24,19 @@ def smart_retry(
         Decorated function with retry logic
     """
     def decorator(func: Callable) -> Callable:
+        # single retry layer: backoff decides when to retry and how long to wait
         @functools.wraps(func)
         @backoff.on_exception(
-            backoff.expo, # exponential backoff - doubles every time
+            backoff.expo, # exponential backoff - 0.5s, 0.75s, 1.125s, ...
             allowed_exceptions,
             max_tries=max_tries,
             on_success=on_success,
             on_giveup=on_permanent_failure,
-            jitter=lambda: random.uniform(0.1, 0.5)
+            jitter=backoff.full_jitter, # random wait up to the backoff time so retries are not synchronized
+            base=1.5,
+            factor=0.5
         )
         def wrapper(*args, **kwargs):
-            try:
-                # initial attempt
-                result = func(*args, **kwargs)
-                return result
-            except yFinanceError as e:
-                # Yahoo Finance specific error handling
-                # random delay so retries are not synchronized
-                backoff_time = random.uniform(0.5, 2.0)
-                print(f"yFinance error occurred, retrying in {backoff_time:.1f} seconds...")
-                import time
-                time.sleep(backoff_time)
-                raise  # raise so backoff handles the retry timing
-
-            except Exception as e:
-                # general random exceptions
-                if not isinstance(e, allowed_exceptions):
-                    raise # not a retryable error
-                raise # retryable error, raise and backoff will handle retry timing
+            return func(*args, **kwargs)
         return wrapper
     return decorator
\ No newline at end of file